@@ -7,12 +7,27 @@ Reads from /transcripts directory and outputs to /transcripts-markdown directory
 """
 
 import argparse
+import io
 import json
 import logging
+import os
+import re
 import string
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional, TextIO, Tuple
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, fall back to the standard library
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # Optional, only used to stream very large transcripts
+    ijson = None
 
 
 # Configure logging
@@ -26,6 +41,52 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Number of files handed to a worker process at a time
+CONVERT_CHUNKSIZE = 8
+
+# strftime formats for meeting dates and transcript timestamps
+DATETIME_FORMAT = '%A, %B %d, %Y at %I:%M %p'
+TIMESTAMP_FORMAT = '%H:%M:%S'
+
+# Length of the shortest string datetime.fromisoformat accepts ('2024W01')
+_MIN_ISO_LENGTH = 7
+
+# Transcript files larger than this are streamed with ijson when it is installed
+STREAM_THRESHOLD_BYTES = 10 * 1024 * 1024
+
+# Top-level fields of a transcript file used in the markdown header
+_HEADER_FIELDS = frozenset(('title', 'created_at', 'updated_at', 'document_id'))
+
+# Buffer size for markdown output files
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Closing lines of every markdown file
+_FOOTER = """
+
+---
+
+*This transcript was downloaded and converted from Granola AI*
+"""
+
+# Characters kept by sanitize_filename; everything else becomes '-'
+_FILENAME_SAFE_CHARS = frozenset(string.printable) - frozenset('<>:"/\\|?*')
+_DASH_RUN = re.compile(r'-{2,}')
+
+
+class _FilenameTable(dict):
+    """
+    str.translate table mapping unsafe code points to '-'
+    Filled lazily so non-ASCII characters need no precomputed entry
+    """
+
+    def __missing__(self, codepoint: int) -> int:
+        replacement = codepoint if chr(codepoint) in _FILENAME_SAFE_CHARS else ord('-')
+        self[codepoint] = replacement
+        return replacement
+
+
+_FILENAME_TABLE = _FilenameTable()
+
 
 def sanitize_filename(filename: str) -> str:
     """
@@ -35,11 +96,10 @@ def sanitize_filename(filename: str) -> str:
         return "untitled"
 
     # Keep only printable characters, replace others with '-'
-    sanitized = ''.join(char if char in string.printable and char not in '<>:"/\\|?*' else '-' for char in filename)
+    sanitized = filename.translate(_FILENAME_TABLE)
 
     # Remove multiple consecutive dashes
-    while '--' in sanitized:
-        sanitized = sanitized.replace('--', '-')
+    sanitized = _DASH_RUN.sub('-', sanitized)
 
     # Remove leading/trailing dashes and limit length
     sanitized = sanitized.strip('-')[:100]
@@ -52,10 +112,13 @@ def format_datetime(iso_string: str) -> str:
     Format ISO datetime string for display
     Adapted from granola-to-markdown/index.ts
     """
+    # Reject values that cannot be ISO dates without raising
+    if not isinstance(iso_string, str) or len(iso_string) < _MIN_ISO_LENGTH:
+        return iso_string
+
     try:
-        dt = datetime.fromisoformat(iso_string.replace('Z', '+00:00'))
-        return dt.strftime('%A, %B %d, %Y at %I:%M %p')
-    except Exception:
+        return datetime.fromisoformat(iso_string).strftime(DATETIME_FORMAT)
+    except ValueError:
         return iso_string
 
 
@@ -63,82 +126,39 @@ def format_timestamp(timestamp_str: str) -> str:
     """
     Format timestamp for transcript entries
     """
+    # Reject values that cannot be ISO dates without raising
+    if not isinstance(timestamp_str, str) or len(timestamp_str) < _MIN_ISO_LENGTH:
+        return timestamp_str
+
     try:
-        # Handle different timestamp formats
-        if timestamp_str.endswith('Z'):
-            dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-        else:
-            dt = datetime.fromisoformat(timestamp_str)
-        return dt.strftime('%H:%M:%S')
-    except Exception:
+        # fromisoformat accepts a trailing 'Z' since Python 3.11
+        return datetime.fromisoformat(timestamp_str).strftime(TIMESTAMP_FORMAT)
+    except ValueError:
         return timestamp_str
 
 
-def format_transcript_entries(entries: List[Dict]) -> str:
+def _sort_field(entry: Dict) -> Tuple[Optional[str], Any]:
     """
-    Format transcript entries into markdown
-    Adapted from granola-to-markdown/index.ts formatTranscript function
+    Pick the field entries are ordered by, and its default when missing
+    Uses sequence_number if available, otherwise the start timestamp
     """
-    if not entries:
-        return "*No transcript available*"
+    for field, default in (('sequence_number', 0), ('start_timestamp', '')):
+        if field in entry:
+            return field, default
 
-    # Sort entries by sequence_number if available, otherwise by timestamp
-    try:
-        if 'sequence_number' in entries[0]:
-            sorted_entries = sorted(entries, key=lambda x: x.get('sequence_number', 0))
-        elif 'start_timestamp' in entries[0]:
-            sorted_entries = sorted(entries, key=lambda x: x.get('start_timestamp', ''))
-        else:
-            sorted_entries = entries
-    except (IndexError, TypeError):
-        sorted_entries = entries
+    return None, None
 
-    formatted_lines = []
 
-    for entry in sorted_entries:
-        text = entry.get('text', '').strip()
-        if not text:
-            continue
-
-        # Determine speaker
-        source = entry.get('source', '')
-        speaker = entry.get('speaker', '')
-
-        if source == 'microphone':
-            speaker_name = 'me'
-        elif speaker:
-            speaker_name = speaker
-        else:
-            speaker_name = 'them'
-
-        # Add timestamp if available
-        start_timestamp = entry.get('start_timestamp')
-        if start_timestamp:
-            timestamp = format_timestamp(start_timestamp)
-            formatted_lines.append(f"**[{timestamp}] {speaker_name}:** {text}")
-        else:
-            formatted_lines.append(f"**{speaker_name}:** {text}")
-
-    return '\n\n'.join(formatted_lines)
-
-
-def calculate_duration(entries: List[Dict]) -> str:
+def _format_duration(start_timestamp: Optional[str], end_timestamp: Optional[str]) -> str:
     """
-    Calculate approximate duration from transcript entries
+    Format the time between two ISO timestamps as hours and minutes
     """
     try:
-        if not entries:
+        if not start_timestamp or not end_timestamp:
             return "Unknown"
 
-        # Get start and end timestamps
-        start_times = [e.get('start_timestamp') for e in entries if e.get('start_timestamp')]
-        end_times = [e.get('end_timestamp') for e in entries if e.get('end_timestamp')]
-
-        if not start_times or not end_times:
-            return "Unknown"
-
-        start_dt = datetime.fromisoformat(min(start_times).replace('Z', '+00:00'))
-        end_dt = datetime.fromisoformat(max(end_times).replace('Z', '+00:00'))
+        start_dt = datetime.fromisoformat(start_timestamp)
+        end_dt = datetime.fromisoformat(end_timestamp)
 
         duration = end_dt - start_dt
 
@@ -154,63 +174,141 @@ def calculate_duration(entries: List[Dict]) -> str:
         return "Unknown"
 
 
-def get_transcript_stats(entries: List[Dict]) -> Dict[str, int]:
+def _walk(entries: Iterable[Dict]) -> Tuple[List[Tuple[Optional[str], str, str]], Dict[str, int], str]:
     """
-    Get basic statistics about the transcript
+    Walk transcript entries once
+    Returns the (start_timestamp, speaker, text) rows to render in display
+    order, the transcript statistics and the approximate duration.
+    Entries may be a stream; only the rows are kept in memory.
     """
-    if not entries:
-        return {"total_entries": 0, "speakers": 0, "words": 0}
-
-    total_entries = len(entries)
+    rows = []
+    sort_keys = []
+    sort_field = default = None
     speakers = set()
+    total_entries = 0
     total_words = 0
+    first_start = None
+    last_end = None
+    span_known = True
+
+    # Local aliases keep attribute lookups out of the per-entry loop
+    append_row = rows.append
+    append_key = sort_keys.append
+    add_speaker = speakers.add
 
     for entry in entries:
-        # Count speakers
-        source = entry.get('source', '')
-        speaker = entry.get('speaker', '')
-
-        if source == 'microphone':
-            speakers.add('me')
-        elif speaker:
-            speakers.add(speaker)
-        else:
-            speakers.add('them')
+        if total_entries == 0:
+            sort_field, default = _sort_field(entry)
+        total_entries += 1
+
+        get = entry.get
+
+        # Determine speaker
+        speaker_name = 'me' if get('source') == 'microphone' else (get('speaker') or 'them')
+        add_speaker(speaker_name)
 
         # Count words
-        text = entry.get('text', '')
+        text = get('text') or ''
         total_words += len(text.split())
 
-    return {
+        # Track the transcript's time span; any timestamp that isn't a string makes it unknown
+        start_timestamp = get('start_timestamp')
+        if start_timestamp:
+            if not isinstance(start_timestamp, str):
+                span_known = False
+            elif first_start is None or start_timestamp < first_start:
+                first_start = start_timestamp
+
+        end_timestamp = get('end_timestamp')
+        if end_timestamp:
+            if not isinstance(end_timestamp, str):
+                span_known = False
+            elif last_end is None or end_timestamp > last_end:
+                last_end = end_timestamp
+
+        # Blank entries keep a placeholder so they sort exactly as before
+        text = text.strip()
+        append_row((start_timestamp, speaker_name, text) if text else None)
+        if sort_field is not None:
+            append_key(get(sort_field, default))
+
+    if sort_field is not None:
+        try:
+            order = sorted(range(len(rows)), key=sort_keys.__getitem__)
+            rows = [rows[i] for i in order]
+        except TypeError:
+            pass
+
+    stats = {
         "total_entries": total_entries,
         "speakers": len(speakers),
         "words": total_words
     }
 
+    duration = _format_duration(first_start, last_end) if span_known else "Unknown"
 
-def generate_markdown(transcript_data: Dict) -> str:
+    return [row for row in rows if row is not None], stats, duration
+
+
+def _write_rows(out: TextIO, rows: List[Tuple[Optional[str], str, str]]) -> None:
     """
-    Generate markdown content from transcript JSON data
+    Write prepared transcript rows to out as markdown, one row at a time
+    """
+    write = out.write
+    format_time = format_timestamp
+
+    for index, (start_timestamp, speaker_name, text) in enumerate(rows):
+        if index:
+            write('\n\n')
+
+        # Add timestamp if available
+        if start_timestamp:
+            write(f"**[{format_time(start_timestamp)}] {speaker_name}:** {text}")
+        else:
+            write(f"**{speaker_name}:** {text}")
+
+
+def format_transcript_entries(entries: List[Dict]) -> str:
+    """
+    Format transcript entries into markdown
+    Adapted from granola-to-markdown/index.ts formatTranscript function
+    """
+    if not entries:
+        return "*No transcript available*"
+
+    out = io.StringIO()
+    _write_rows(out, _walk(entries)[0])
+    return out.getvalue()
+
+
+def calculate_duration(entries: List[Dict]) -> str:
+    """
+    Calculate approximate duration from transcript entries
+    """
+    return _walk(entries or [])[2]
+
+
+def get_transcript_stats(entries: List[Dict]) -> Dict[str, int]:
+    """
+    Get basic statistics about the transcript
+    """
+    return _walk(entries or [])[1]
+
+
+def _render_header(transcript_data: Dict, stats: Dict[str, int], duration: str) -> str:
+    """
+    Render the markdown title, meeting details and statistics
     """
     title = transcript_data.get('title', 'Untitled Meeting')
     created_at = transcript_data.get('created_at', '')
     updated_at = transcript_data.get('updated_at', '')
     document_id = transcript_data.get('document_id', '')
-    entries = transcript_data.get('transcript_entries', [])
 
     # Format dates
     formatted_created = format_datetime(created_at) if created_at else 'Unknown'
     formatted_updated = format_datetime(updated_at) if updated_at else 'Unknown'
 
-    # Get transcript statistics
-    stats = get_transcript_stats(entries)
-    duration = calculate_duration(entries)
-
-    # Format transcript content
-    formatted_transcript = format_transcript_entries(entries)
-
-    # Generate markdown
-    markdown_content = f"""# {title}
+    return f"""# {title}
 
 **Date:** {formatted_created}
 **Updated:** {formatted_updated}
@@ -229,49 +327,103 @@ def generate_markdown(transcript_data: Dict) -> str:
 
 ## Transcript
 
-{formatted_transcript}
+"""
 
----
 
-*This transcript was downloaded and converted from Granola AI*
-"""
+def write_markdown(out: TextIO, transcript_data: Dict, rows: List[Tuple[Optional[str], str, str]],
+                   stats: Dict[str, int], duration: str) -> None:
+    """
+    Write the markdown document to out incrementally
+    Takes the rows, statistics and duration returned by _walk
+    """
+    out.write(_render_header(transcript_data, stats, duration))
 
-    return markdown_content
+    if stats['total_entries']:
+        _write_rows(out, rows)
+    else:
+        out.write("*No transcript available*")
 
+    out.write(_FOOTER)
 
-def convert_transcript_file(json_path: Path, output_path: Path, force: bool = False) -> bool:
+
+def generate_markdown(transcript_data: Dict) -> str:
+    """
+    Generate markdown content from transcript JSON data
+    """
+    out = io.StringIO()
+    write_markdown(out, transcript_data, *_walk(transcript_data.get('transcript_entries') or []))
+    return out.getvalue()
+
+
+def _read_header_fields(f: BinaryIO) -> Dict:
+    """
+    Read the top-level header fields of a transcript file with ijson,
+    without loading its entries
+    """
+    fields = {}
+
+    for prefix, event, value in ijson.parse(f):
+        if prefix in _HEADER_FIELDS and event in ('string', 'number', 'boolean', 'null'):
+            fields[prefix] = value
+            if len(fields) == len(_HEADER_FIELDS):
+                break
+
+    return fields
+
+
+def convert_transcript_file(json_path: Path, output_path: Path) -> str:
     """
     Convert a single JSON transcript file to Markdown
+    Returns "converted" or "error"; skipping existing files is up to the caller
     """
     try:
-        # Check if output file already exists
-        if output_path.exists() and not force:
-            logger.debug(f"Skipping {output_path.name} (already exists)")
-            return False
-
-        # Read JSON file
-        with open(json_path, 'r', encoding='utf-8') as f:
-            transcript_data = json.load(f)
+        with open(json_path, 'rb') as f:
+            if ijson is not None and os.fstat(f.fileno()).st_size > STREAM_THRESHOLD_BYTES:
+                # Stream the entries of very large transcripts instead of loading them
+                transcript_data = _read_header_fields(f)
+                f.seek(0)
+                entries = ijson.items(f, 'transcript_entries.item', use_float=True)
+            else:
+                # Read JSON file
+                raw = f.read()
+                transcript_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                entries = transcript_data.get('transcript_entries') or []
 
-        # Generate markdown
-        markdown_content = generate_markdown(transcript_data)
+            # Collect rows and statistics before creating the output file
+            rows, stats, duration = _walk(entries)
 
         # Write markdown file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(markdown_content)
+        with open(output_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as out:
+            write_markdown(out, transcript_data, rows, stats, duration)
 
-        logger.debug(f"Converted: {json_path.name} -> {output_path.name}")
-        return True
+        logger.debug("Converted: %s -> %s", json_path.name, output_path.name)
+        return "converted"
 
     except Exception as e:
-        logger.error(f"Error converting {json_path.name}: {str(e)}")
-        return False
+        logger.error("Error converting %s: %s", json_path.name, e)
+        return "error"
+
+
+def _init_worker(level: int) -> None:
+    """
+    Initialize a worker process so it logs at the same level as the parent
+    """
+    logging.getLogger().setLevel(level)
+
+
+def _convert_star(task: Tuple[Path, Path]) -> str:
+    """
+    Unpack a task tuple for ProcessPoolExecutor.map
+    """
+    json_path, output_path = task
+    logger.info("Converting: %s", json_path.name)
+    return convert_transcript_file(json_path, output_path)
 
 
 def convert_transcripts(input_dir: str = "transcripts", output_dir: str = "transcripts-markdown",
-                       force: bool = False, verbose: bool = False) -> None:
+                       force: bool = False, verbose: bool = False, workers: Optional[int] = None) -> None:
     """
-    Convert all JSON transcript files to Markdown
+    Convert all JSON transcript files to Markdown using a pool of worker processes
     """
     try:
         # Set up logging level
@@ -283,56 +435,86 @@ def convert_transcripts(input_dir: str = "transcripts", output_dir: str = "trans
         output_path = Path(output_dir)
 
         if not input_path.exists():
-            logger.error(f"Input directory '{input_path}' does not exist")
+            logger.error("Input directory '%s' does not exist", input_path)
             return
 
         # Create output directory
         output_path.mkdir(exist_ok=True)
-        logger.info(f"Input directory: {input_path.absolute()}")
-        logger.info(f"Output directory: {output_path.absolute()}")
+        logger.info("Input directory: %s", input_path.absolute())
+        logger.info("Output directory: %s", output_path.absolute())
 
         # Find all JSON files
-        json_files = list(input_path.glob("*.json"))
+        with os.scandir(input_path) as it:
+            json_files = [entry for entry in it if entry.name.endswith('.json') and entry.is_file()]
 
         if not json_files:
-            logger.warning(f"No JSON files found in {input_path}")
+            logger.warning("No JSON files found in %s", input_path)
             return
 
-        logger.info(f"Found {len(json_files)} JSON files to convert")
+        logger.info("Found %s JSON files to convert", len(json_files))
 
-        # Convert files
-        converted_count = 0
+        # Decide which files need converting before starting any workers,
+        # using one listing of the output directory instead of a stat per file
+        existing = set()
+        if not force:
+            with os.scandir(output_path) as it:
+                existing = {entry.name for entry in it}
+
+        # Output name -> input file, so no two workers ever write the same file
+        scheduled = {}
         skipped_count = 0
-        error_count = 0
 
         for json_file in json_files:
             # Generate output filename (replace .json with .md and sanitize)
-            sanitized_stem = sanitize_filename(json_file.stem)
-            output_file = output_path / f"{sanitized_stem}.md"
-
-            logger.info(f"Converting: {json_file.name}")
+            output_name = f"{sanitize_filename(os.path.splitext(json_file.name)[0])}.md"
 
-            result = convert_transcript_file(json_file, output_file, force)
+            # Skip if file exists and not forcing overwrite; later inputs with the same output name are skipped too
+            if not force and (output_name in existing or output_name in scheduled):
+                logger.debug("Skipping %s (already exists)", output_name)
+                skipped_count += 1
+                continue
 
-            if result:
-                converted_count += 1
-            elif output_file.exists() and not force:
+            # When forcing, each input would overwrite the one before it, so the last one wins
+            if output_name in scheduled:
+                logger.debug("Skipping earlier input for %s (replaced by a later one)", output_name)
                 skipped_count += 1
-            else:
-                error_count += 1
+
+            scheduled[output_name] = json_file.path
+
+        tasks = [(Path(json_path), output_path / output_name) for output_name, json_path in scheduled.items()]
+
+        # Convert files in parallel, one task per (input, output) tuple
+        results = Counter()
+        if tasks:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(logging.getLogger().level,)) as executor:
+                results.update(executor.map(_convert_star, tasks, chunksize=CONVERT_CHUNKSIZE))
+
+        converted_count = results["converted"]
+        error_count = results["error"]
 
         # Summary
-        logger.info(f"Conversion complete!")
-        logger.info(f"Converted: {converted_count} files")
-        logger.info(f"Skipped: {skipped_count} (already exist)")
-        logger.info(f"Errors: {error_count}")
-        logger.info(f"Markdown files saved to: {output_path.absolute()}")
+        logger.info("Conversion complete!")
+        logger.info("Converted: %s files", converted_count)
+        logger.info("Skipped: %s (already exist)", skipped_count)
+        logger.info("Errors: %s", error_count)
+        logger.info("Markdown files saved to: %s", output_path.absolute())
 
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
+        logger.error("Unexpected error: %s", e)
         raise
 
 
+def positive_int(value: str) -> int:
+    """
+    argparse type for counts that must be at least 1
+    """
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Convert JSON transcript files to Markdown format"
@@ -357,6 +539,12 @@ def main():
         action="store_true",
         help="Enable verbose logging"
     )
+    parser.add_argument(
+        "-w", "--workers",
+        type=positive_int,
+        default=os.cpu_count(),
+        help="Number of worker processes (default: number of CPUs)"
+    )
 
     args = parser.parse_args()
 
@@ -365,12 +553,13 @@ def main():
             input_dir=args.input,
             output_dir=args.output,
             force=args.force,
-            verbose=args.verbose
+            verbose=args.verbose,
+            workers=args.workers
         )
     except KeyboardInterrupt:
         logger.info("Conversion interrupted by user")
     except Exception as e:
-        logger.error(f"Conversion failed: {str(e)}")
+        logger.error("Conversion failed: %s", e)
         exit(1)
 
 
@@ -10,11 +10,22 @@ import argparse
 import logging
 import json
 import os
+import re
 import requests
-import time
-from datetime import datetime, timedelta
+import sqlite3
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from itertools import count
 from pathlib import Path
-from typing import List, Dict, Optional
+from requests.adapters import HTTPAdapter
+from typing import List, Dict, Optional, Set, Tuple
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, fall back to the standard library
+    orjson = None
 
 
 # Configure logging
@@ -28,6 +39,35 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Headers sent with every API request, alongside the bearer token
+API_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "*/*",
+    "User-Agent": "Granola/5.354.0",
+    "X-Client-Version": "5.354.0"
+}
+
+# strftime format for the date prefix of output filenames
+DATE_FORMAT = '%Y-%m-%d'
+
+# Characters that are not allowed in filenames
+_INVALID_FILENAME_CHARS = str.maketrans('', '', '<>:"/\\|?*')
+_WHITESPACE_RUN = re.compile(r'\s+')
+
+# Number of document pages requested concurrently
+PAGE_CONCURRENCY = 8
+
+# Output formats: one JSON file per meeting, or a single JSONL file / SQLite database
+OUTPUT_FORMATS = ('json', 'jsonl', 'sqlite')
+STORE_FILENAMES = {'jsonl': 'meetings.jsonl', 'sqlite': 'meetings.db'}
+
+
+def parse_json(data: bytes):
+    """
+    Parse JSON bytes, using orjson when it is installed
+    """
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
 
 def load_credentials() -> Optional[str]:
     """
@@ -36,15 +76,14 @@ def load_credentials() -> Optional[str]:
     """
     creds_path = Path.home() / "Library/Application Support/Granola/supabase.json"
     if not creds_path.exists():
-        logger.error(f"Credentials file not found at: {creds_path}")
+        logger.error("Credentials file not found at: %s", creds_path)
         return None
 
     try:
-        with open(creds_path, 'r') as f:
-            data = json.load(f)
+        data = parse_json(creds_path.read_bytes())
 
         # Parse the cognito_tokens string into a dict
-        cognito_tokens = json.loads(data['cognito_tokens'])
+        cognito_tokens = parse_json(data['cognito_tokens'])
         access_token = cognito_tokens.get('access_token')
 
         if not access_token:
@@ -54,61 +93,88 @@ def load_credentials() -> Optional[str]:
         logger.debug("Successfully loaded credentials")
         return access_token
     except Exception as e:
-        logger.error(f"Error reading credentials file: {str(e)}")
+        logger.error("Error reading credentials file: %s", e)
         return None
 
 
-def fetch_granola_documents(token: str, limit: int = 100) -> Optional[List[Dict]]:
+def create_session(token: str) -> requests.Session:
     """
-    Fetch all documents from Granola API with pagination
-    Adapted from sample_python.py and download_transcripts.py
+    Create an HTTP session with pooled keep-alive connections
+    Retries rate-limited and failed requests, honouring Retry-After
     """
-    url = "https://api.granola.ai/v2/get-documents"
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json",
-        "Accept": "*/*",
-        "User-Agent": "Granola/5.354.0",
-        "X-Client-Version": "5.354.0"
-    }
+    session = requests.Session()
+    session.headers.update(API_HEADERS)
+    session.headers["Authorization"] = f"Bearer {token}"
+
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset(["POST"]),
+        raise_on_status=False
+    )
+    session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retry))
+    return session
 
-    all_documents = []
-    offset = 0
 
-    while True:
-        data = {
-            "limit": limit,
-            "offset": offset,
-            "include_last_viewed_panel": True  # Include panel data for complete metadata
-        }
+def fetch_documents_page(session: requests.Session, url: str, offset: int, limit: int) -> List[Dict]:
+    """
+    Fetch a single page of documents
+    """
+    data = {
+        "limit": limit,
+        "offset": offset,
+        "include_last_viewed_panel": True  # Include panel data for complete metadata
+    }
 
-        try:
-            logger.debug(f"Fetching documents with offset {offset}")
-            response = requests.post(url, headers=headers, json=data)
-            response.raise_for_status()
+    logger.debug("Fetching documents with offset %s", offset)
+    response = session.post(url, json=data)
+    response.raise_for_status()
 
-            result = response.json()
-            documents = result.get("docs", [])
+    return response.json().get("docs", [])
 
-            if not documents:
-                break
 
+def fetch_granola_documents(token: str, limit: int = 100) -> Optional[List[Dict]]:
+    """
+    Fetch all documents from Granola API with pagination
+    Keeps PAGE_CONCURRENCY page requests in flight until a short page is seen
+    """
+    url = "https://api.granola.ai/v2/get-documents"
+    all_documents = []
+
+    try:
+        with create_session(token) as session, ThreadPoolExecutor(max_workers=PAGE_CONCURRENCY) as executor:
+            # The first page tells us whether there is anything more to fetch
+            documents = fetch_documents_page(session, url, 0, limit)
             all_documents.extend(documents)
 
-            # Check if we've reached the end
-            if len(documents) < limit:
-                break
+            if len(documents) >= limit:
+                offsets = count(limit, limit)
+                pending = deque(
+                    executor.submit(fetch_documents_page, session, url, next(offsets), limit)
+                    for _ in range(PAGE_CONCURRENCY)
+                )
 
-            offset += limit
+                # Consume pages in order, requesting a new page as each one arrives
+                while pending:
+                    documents = pending.popleft().result()
+                    all_documents.extend(documents)
 
-            # Add small delay to be respectful to the API
-            time.sleep(0.1)
+                    # Check if we've reached the end
+                    if len(documents) < limit:
+                        break
 
-        except Exception as e:
-            logger.error(f"Error fetching documents: {str(e)}")
-            return None
+                    pending.append(executor.submit(fetch_documents_page, session, url, next(offsets), limit))
 
-    logger.info(f"Successfully fetched {len(all_documents)} documents")
+                # Pages past the end are not needed
+                for future in pending:
+                    future.cancel()
+
+    except Exception as e:
+        logger.error("Error fetching documents: %s", e)
+        return None
+
+    logger.info("Successfully fetched %s documents", len(all_documents))
     return all_documents
 
 
@@ -117,15 +183,14 @@ def sanitize_filename(title: str) -> str:
     Convert a title to a valid filename
     Enhanced version from existing scripts
     """
-    if not title or title.strip() == "":
+    if not title or not title.strip():
         return "untitled"
 
     # Remove invalid characters
-    invalid_chars = '<>:"/\\|?*'
-    filename = ''.join(c for c in title if c not in invalid_chars)
+    filename = title.translate(_INVALID_FILENAME_CHARS)
 
     # Replace multiple spaces with single underscore
-    filename = '_'.join(filename.split())
+    filename = _WHITESPACE_RUN.sub('_', filename.strip())
 
     # Remove leading/trailing underscores and limit length
     filename = filename.strip('_')[:100]
@@ -133,6 +198,24 @@ def sanitize_filename(title: str) -> str:
     return filename if filename else "untitled"
 
 
+def generate_filename(title: str, created_at: str, fallback_date_str: str) -> str:
+    """
+    Generate a filename from document metadata
+    fallback_date_str is used when created_at is missing or unparseable
+    """
+    try:
+        if created_at:
+            date_obj = datetime.fromisoformat(created_at)
+            date_str = date_obj.strftime(DATE_FORMAT)
+        else:
+            date_str = fallback_date_str
+    except Exception:
+        date_str = fallback_date_str
+
+    sanitized_title = sanitize_filename(title)
+    return f"{date_str}_{sanitized_title}.json"
+
+
 def filter_documents_by_date(documents: List[Dict], days_ago: Optional[int]) -> List[Dict]:
     """
     Filter documents by creation date
@@ -140,7 +223,8 @@ def filter_documents_by_date(documents: List[Dict], days_ago: Optional[int]) ->
     if days_ago is None:
         return documents
 
-    cutoff_date = datetime.now() - timedelta(days=days_ago)
+    # API timestamps carry a UTC offset, so the cutoff must be timezone-aware too
+    cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_ago)
     filtered_docs = []
 
     for doc in documents:
@@ -148,21 +232,22 @@ def filter_documents_by_date(documents: List[Dict], days_ago: Optional[int]) ->
             # Parse the document creation date
             created_at = doc.get('created_at')
             if created_at:
-                doc_date = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
+                doc_date = datetime.fromisoformat(created_at)
                 if doc_date >= cutoff_date:
                     filtered_docs.append(doc)
         except Exception as e:
-            logger.debug(f"Error parsing date for document {doc.get('id', 'unknown')}: {e}")
+            logger.debug("Error parsing date for document %s: %s", doc.get('id', 'unknown'), e)
             # Include documents with unparseable dates
             filtered_docs.append(doc)
 
-    logger.info(f"Filtered to {len(filtered_docs)} documents from last {days_ago} days")
+    logger.info("Filtered to %s documents from last %s days", len(filtered_docs), days_ago)
     return filtered_docs
 
 
-def process_document_metadata(doc: Dict) -> Dict:
+def process_document_metadata(doc: Dict, download_timestamp: str, include_raw: bool = False) -> Dict:
     """
     Process and structure document metadata for JSON output
+    The complete API response is only embedded when include_raw is set
     """
     doc_id = doc.get('id', 'unknown')
     title = doc.get('title', 'Untitled Meeting')
@@ -203,18 +288,133 @@ def process_document_metadata(doc: Dict) -> Dict:
         'title': title,
         'created_at': created_at,
         'updated_at': updated_at,
-        'download_timestamp': datetime.now().isoformat(),
+        'download_timestamp': download_timestamp,
         'metadata': metadata,
         'notes': notes,
-        'calendar_info': calendar_info,
-        'raw_document': doc  # Complete API response for reference
+        'calendar_info': calendar_info
     }
 
+    if include_raw:
+        meeting_data['raw_document'] = doc  # Complete API response for reference
+
     return meeting_data
 
 
+def serialize_pretty(meeting_data: Dict) -> bytes:
+    """
+    Serialize meeting data as indented UTF-8 JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(meeting_data, option=orjson.OPT_INDENT_2)
+    return json.dumps(meeting_data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def serialize_compact(meeting_data: Dict) -> bytes:
+    """
+    Serialize meeting data as a single line of UTF-8 JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(meeting_data)
+    return json.dumps(meeting_data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def open_sqlite_store(store_path: Path) -> sqlite3.Connection:
+    """
+    Open the SQLite meeting store, creating the table if needed
+    """
+    conn = sqlite3.connect(store_path)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS meetings "
+        "(document_id TEXT PRIMARY KEY, created_at TEXT, data BLOB)"
+    )
+    return conn
+
+
+def load_stored_ids(store_path: Path, output_format: str) -> Set[str]:
+    """
+    Return the document IDs already saved in a JSONL or SQLite store
+    """
+    if not store_path.exists():
+        return set()
+
+    if output_format == 'sqlite':
+        conn = open_sqlite_store(store_path)
+        try:
+            return {row[0] for row in conn.execute("SELECT document_id FROM meetings")}
+        finally:
+            conn.close()
+
+    stored_ids = set()
+    with open(store_path, 'rb') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                record = orjson.loads(line) if orjson is not None else json.loads(line)
+                stored_ids.add(record['document_id'])
+            except Exception as e:
+                logger.debug("Ignoring unreadable line in %s: %s", store_path.name, e)
+
+    return stored_ids
+
+
+def open_store(store_path: Path, output_format: str, force: bool):
+    """
+    Open a JSONL or SQLite store for writing records one meeting at a time
+    With --force, JSONL records go to a temporary file that replaces the store in close_store
+    """
+    if output_format == 'sqlite':
+        return open_sqlite_store(store_path)
+    if force:
+        return open(store_path.with_name(store_path.name + '.tmp'), 'wb')
+    return open(store_path, 'ab')
+
+
+def write_record(store, output_format: str, record: Tuple[str, str, bytes], force: bool) -> None:
+    """
+    Write one (document_id, created_at, json) record to an open store
+    """
+    if output_format == 'sqlite':
+        verb = "INSERT OR REPLACE" if force else "INSERT OR IGNORE"
+        store.execute(f"{verb} INTO meetings VALUES (?, ?, ?)", record)
+    else:
+        store.write(record[2] + b'\n')
+
+
+def close_store(store, store_path: Path, output_format: str, force: bool, written_ids: Set[str]) -> None:
+    """
+    Commit and close a store opened with open_store
+    With --force, JSONL records not rewritten in this run are carried over before the store is replaced
+    """
+    if output_format == 'sqlite':
+        try:
+            store.commit()
+        finally:
+            store.close()
+        return
+
+    try:
+        if force and store_path.exists():
+            with open(store_path, 'rb') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        record = orjson.loads(line) if orjson is not None else json.loads(line)
+                        if record['document_id'] in written_ids:
+                            continue
+                    except Exception as e:
+                        logger.debug("Keeping unreadable line in %s: %s", store_path.name, e)
+                    store.write(line if line.endswith(b'\n') else line + b'\n')
+    finally:
+        store.close()
+    if force:
+        os.replace(store.name, store_path)
+
+
 def download_meetings(output_dir: str = "meetings", days_ago: Optional[int] = None,
-                     force: bool = False, verbose: bool = False) -> None:
+                     force: bool = False, verbose: bool = False, include_raw: bool = False,
+                     output_format: str = 'json') -> None:
     """
     Main function to download all meeting metadata
     """
@@ -226,7 +426,7 @@ def download_meetings(output_dir: str = "meetings", days_ago: Optional[int] = No
         # Create output directory
         output_path = Path(output_dir)
         output_path.mkdir(exist_ok=True)
-        logger.info(f"Output directory: {output_path.absolute()}")
+        logger.info("Output directory: %s", output_path.absolute())
 
         # Load credentials
         logger.info("Loading Granola credentials...")
@@ -251,66 +451,85 @@ def download_meetings(output_dir: str = "meetings", days_ago: Optional[int] = No
             return
 
         # Download meeting metadata
-        logger.info(f"Starting metadata download for {len(documents)} documents...")
+        logger.info("Starting metadata download for %s documents...", len(documents))
 
         downloaded_count = 0
         skipped_count = 0
         error_count = 0
 
-        for i, doc in enumerate(documents, 1):
-            doc_id = doc.get('id', 'unknown')
-            title = doc.get('title', 'Untitled')
-            created_at = doc.get('created_at', '')
-
-            logger.info(f"Processing [{i}/{len(documents)}]: {title}")
+        # Single-store formats write each record to one open JSONL file or SQLite database
+        store = None
+        stored_ids = set()
+        if output_format != 'json':
+            store_path = output_path / STORE_FILENAMES[output_format]
+            if not force:
+                stored_ids = load_stored_ids(store_path, output_format)
+            store = open_store(store_path, output_format, force)
 
-            # Format filename
-            try:
-                if created_at:
-                    date_obj = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                    date_str = date_obj.strftime('%Y-%m-%d')
-                else:
-                    date_str = datetime.now().strftime('%Y-%m-%d')
-            except Exception:
-                date_str = datetime.now().strftime('%Y-%m-%d')
-
-            sanitized_title = sanitize_filename(title)
-            filename = f"{date_str}_{sanitized_title}.json"
-            file_path = output_path / filename
-
-            # Skip if file exists and not forcing overwrite
-            if file_path.exists() and not force:
-                logger.debug(f"Skipping {filename} (already exists)")
-                skipped_count += 1
-                continue
+        # Computed once per run rather than per document
+        now = datetime.now()
+        fallback_date_str = now.strftime(DATE_FORMAT)
+        download_timestamp = now.isoformat()
 
-            # Process document metadata
-            try:
-                meeting_data = process_document_metadata(doc)
-
-                # Save to file
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(meeting_data, f, indent=2, ensure_ascii=False)
-
-                logger.debug(f"Saved: {filename}")
-                downloaded_count += 1
-
-            except Exception as e:
-                logger.error(f"Error processing {title}: {str(e)}")
-                error_count += 1
-
-            # Small delay to be respectful to the API
-            time.sleep(0.05)  # Smaller delay since we're not making additional API calls
+        try:
+            for i, doc in enumerate(documents, 1):
+                doc_id = doc.get('id', 'unknown')
+                title = doc.get('title', 'Untitled')
+                created_at = doc.get('created_at', '')
+
+                logger.info("Processing [%s/%s]: %s", i, len(documents), title)
+
+                if output_format == 'json':
+                    filename = generate_filename(title, created_at, fallback_date_str)
+                    file_path = output_path / filename
+
+                    # Skip if file exists and not forcing overwrite
+                    if file_path.exists() and not force:
+                        logger.debug("Skipping %s (already exists)", filename)
+                        skipped_count += 1
+                        continue
+
+                # Skip if already stored (or seen earlier in this run)
+                elif doc_id in stored_ids:
+                    logger.debug("Skipping %s (already stored)", doc_id)
+                    skipped_count += 1
+                    continue
+
+                # Process document metadata
+                try:
+                    meeting_data = process_document_metadata(doc, download_timestamp, include_raw)
+
+                    if output_format == 'json':
+                        # Save to file
+                        file_path.write_bytes(serialize_pretty(meeting_data))
+
+                        logger.debug("Saved: %s", filename)
+                    else:
+                        record = (doc_id, created_at, serialize_compact(meeting_data))
+                        write_record(store, output_format, record, force)
+                        stored_ids.add(doc_id)
+
+                    downloaded_count += 1
+
+                except Exception as e:
+                    logger.error("Error processing %s: %s", title, e)
+                    error_count += 1
+        finally:
+            if store is not None:
+                close_store(store, store_path, output_format, force, stored_ids)
 
         # Summary
-        logger.info(f"Download complete!")
-        logger.info(f"Downloaded: {downloaded_count} meeting files")
-        logger.info(f"Skipped: {skipped_count} (already exist)")
-        logger.info(f"Errors: {error_count} (processing failed)")
-        logger.info(f"Files saved to: {output_path.absolute()}")
+        logger.info("Download complete!")
+        logger.info("Downloaded: %s meetings", downloaded_count)
+        logger.info("Skipped: %s (already exist)", skipped_count)
+        logger.info("Errors: %s (processing failed)", error_count)
+        if output_format == 'json':
+            logger.info("Files saved to: %s", output_path.absolute())
+        else:
+            logger.info("Meetings saved to: %s", store_path.absolute())
 
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
+        logger.error("Unexpected error: %s", e)
         raise
 
 
@@ -338,6 +557,18 @@ def main():
         action="store_true",
         help="Enable verbose logging"
     )
+    parser.add_argument(
+        "--include-raw",
+        action="store_true",
+        help="Also store the complete API response under raw_document"
+    )
+    parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="json",
+        help="json: one file per meeting; jsonl: append to meetings.jsonl; "
+             "sqlite: insert into meetings.db (default: json)"
+    )
 
     args = parser.parse_args()
 
@@ -346,12 +577,14 @@ def main():
             output_dir=args.output,
             days_ago=args.days,
             force=args.force,
-            verbose=args.verbose
+            verbose=args.verbose,
+            include_raw=args.include_raw,
+            output_format=args.format
         )
     except KeyboardInterrupt:
         logger.info("Download interrupted by user")
     except Exception as e:
-        logger.error(f"Download failed: {str(e)}")
+        logger.error("Download failed: %s", e)
         exit(1)
 
 
@@ -9,12 +9,26 @@ and saves them as JSON files in the format YYYY-MM-DD_(document_name).json
 import argparse
 import logging
 import json
+import os
+import queue
+import re
+import threading
+import time
 
 import requests
-import time
-from datetime import datetime, timedelta
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from itertools import chain, count
 from pathlib import Path
-from typing import List, Dict, Optional
+from requests.adapters import HTTPAdapter
+from typing import List, Dict, Iterable, Iterator, Optional, Tuple, Union
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, fall back to the standard library
+    orjson = None
 
 
 # Configure logging
@@ -28,6 +42,71 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Headers sent with every API request, alongside the bearer token
+API_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "*/*",
+    "User-Agent": "Granola/5.354.0",
+    "X-Client-Version": "5.354.0"
+}
+
+# strftime format for the date prefix of output filenames
+DATE_FORMAT = '%Y-%m-%d'
+
+# Characters that are not allowed in filenames
+_INVALID_FILENAME_CHARS = str.maketrans('', '', '<>:"/\\|?*')
+_WHITESPACE_RUN = re.compile(r'\s+')
+
+# A transcript response body is a JSON array
+_JSON_ARRAY_START = re.compile(rb'[ \t\r\n]*\[')
+
+# Number of transcripts fetched concurrently
+DEFAULT_WORKERS = 10
+
+# Number of transcripts saved concurrently
+WRITER_WORKERS = 4
+
+# Fetched transcripts waiting to be saved; fetch threads block once it is full
+SAVE_QUEUE_SIZE = 64
+
+# Number of document pages requested concurrently
+PAGE_CONCURRENCY = 4
+
+# Average number of API requests allowed per second
+DEFAULT_RATE_LIMIT = 20
+
+# Chunk size when streaming an oversized transcript from the response to disk
+STREAM_CHUNK_SIZE = 1 << 20
+
+# Flags for creating transcript files, with O_EXCL or O_TRUNC added depending on whether they may be overwritten
+OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | getattr(os, 'O_BINARY', 0)
+
+# Transcripts larger than this are streamed to disk instead of read into memory
+STREAM_THRESHOLD_BYTES = 10 * 1024 * 1024
+
+# Sidecar in the output directory mapping document IDs to transcript ETags.
+# Not a .json file, so convert_to_markdown.py does not pick it up
+ETAG_CACHE_FILENAME = '.etags'
+
+# Returned by fetch_transcript when the server reports the transcript unchanged
+NOT_MODIFIED = object()
+
+
+def parse_json(data: bytes):
+    """
+    Parse JSON bytes, using orjson when it is installed
+    """
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def serialize_pretty(data: Dict) -> bytes:
+    """
+    Serialize data as indented UTF-8 JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
 
 def load_credentials() -> Optional[str]:
     """
@@ -36,15 +115,14 @@ def load_credentials() -> Optional[str]:
     """
     creds_path = Path.home() / "Library/Application Support/Granola/supabase.json"
     if not creds_path.exists():
-        logger.error(f"Credentials file not found at: {creds_path}")
+        logger.error("Credentials file not found at: %s", creds_path)
         return None
 
     try:
-        with open(creds_path, 'r') as f:
-            data = json.load(f)
+        data = parse_json(creds_path.read_bytes())
 
         # Parse the cognito_tokens string into a dict
-        cognito_tokens = json.loads(data['cognito_tokens'])
+        cognito_tokens = parse_json(data['cognito_tokens'])
         access_token = cognito_tokens.get('access_token')
 
         if not access_token:
@@ -54,101 +132,195 @@ def load_credentials() -> Optional[str]:
         logger.debug("Successfully loaded credentials")
         return access_token
     except Exception as e:
-        logger.error(f"Error reading credentials file: {str(e)}")
+        logger.error("Error reading credentials file: %s", e)
         return None
 
 
-def fetch_granola_documents(token: str, limit: int = 100) -> Optional[List[Dict]]:
+class RateLimiter:
     """
-    Fetch documents from Granola API
-    Adapted from sample_python.py
+    Thread-safe token bucket allowing `rate` requests per second on average
+    Up to `rate` requests may go out back to back before callers start waiting
     """
-    url = "https://api.granola.ai/v2/get-documents"
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json",
-        "Accept": "*/*",
-        "User-Agent": "Granola/5.354.0",
-        "X-Client-Version": "5.354.0"
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.capacity = max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take a token, sleeping until one is available"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+            # Reserve a token even if the bucket is empty, then wait outside the lock for it to refill
+            self.tokens -= 1
+            wait = -self.tokens / self.rate
+
+        if wait > 0:
+            time.sleep(wait)
+
+
+class RateLimitedSession(requests.Session):
+    """
+    Session that takes a token from a RateLimiter before every request
+    Only the first attempt is limited: urllib3 resends 429/5xx responses without taking another token,
+    relying on Retry-After and the retry backoff to space them out
+    """
+
+    def __init__(self, rate_limiter: RateLimiter):
+        super().__init__()
+        self.rate_limiter = rate_limiter
+
+    def request(self, *args, **kwargs):
+        self.rate_limiter.acquire()
+        return super().request(*args, **kwargs)
+
+
+def create_session(token: str, pool_size: int = DEFAULT_WORKERS,
+                   rate: float = DEFAULT_RATE_LIMIT) -> requests.Session:
+    """
+    Create an HTTP session with pooled keep-alive connections
+    Retries rate-limited and failed requests, honouring Retry-After
+    Requests are limited to `rate` per second across all threads (0 disables the limit); retries are not
+    The pool keeps one connection per concurrent request, so none is reopened mid-run
+    """
+    session = RateLimitedSession(RateLimiter(rate)) if rate > 0 else requests.Session()
+    session.headers.update(API_HEADERS)
+    session.headers["Authorization"] = f"Bearer {token}"
+
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset(["POST"]),
+        raise_on_status=False
+    )
+    session.mount("https://", HTTPAdapter(pool_maxsize=pool_size, max_retries=retry))
+    return session
+
+
+def fetch_documents_page(session: requests.Session, url: str, offset: int, limit: int) -> List[Dict]:
+    """
+    Fetch a single page of documents
+    """
+    data = {
+        "limit": limit,
+        "offset": offset,
+        "include_last_viewed_panel": False  # We don't need panel data for transcripts
     }
 
-    all_documents = []
-    offset = 0
+    logger.debug("Fetching documents with offset %s", offset)
+    response = session.post(url, json=data)
+    response.raise_for_status()
 
-    while True:
-        data = {
-            "limit": limit,
-            "offset": offset,
-            "include_last_viewed_panel": False  # We don't need panel data for transcripts
-        }
+    return parse_json(response.content).get("docs", [])
 
-        try:
-            logger.debug(f"Fetching documents with offset {offset}")
-            response = requests.post(url, headers=headers, json=data)
-            response.raise_for_status()
 
-            result = response.json()
-            documents = result.get("docs", [])
+def fetch_granola_documents(session: requests.Session, limit: int = 100) -> Optional[List[Dict]]:
+    """
+    Fetch documents from Granola API
+    Keeps PAGE_CONCURRENCY page requests in flight until a short page is seen
+    """
+    url = "https://api.granola.ai/v2/get-documents"
+    all_documents = []
 
-            if not documents:
-                break
+    try:
+        # The first page tells us whether there is anything more to fetch
+        documents = fetch_documents_page(session, url, 0, limit)
+        all_documents.extend(documents)
 
-            all_documents.extend(documents)
+        if len(documents) >= limit:
+            with ThreadPoolExecutor(max_workers=PAGE_CONCURRENCY) as executor:
+                offsets = count(limit, limit)
+                pending = deque(
+                    executor.submit(fetch_documents_page, session, url, next(offsets), limit)
+                    for _ in range(PAGE_CONCURRENCY)
+                )
 
-            # Check if we've reached the end
-            if len(documents) < limit:
-                break
+                # Consume pages in order, requesting a new page as each one arrives
+                while pending:
+                    documents = pending.popleft().result()
+                    all_documents.extend(documents)
 
-            offset += limit
+                    # Check if we've reached the end
+                    if len(documents) < limit:
+                        break
 
-            # Add small delay to be respectful to the API
-            time.sleep(0.1)
+                    pending.append(executor.submit(fetch_documents_page, session, url, next(offsets), limit))
 
-        except Exception as e:
-            logger.error(f"Error fetching documents: {str(e)}")
-            return None
+                # Pages past the end are not needed
+                for future in pending:
+                    future.cancel()
+
+    except Exception as e:
+        logger.error("Error fetching documents: %s", e)
+        return None
 
-    logger.info(f"Successfully fetched {len(all_documents)} documents")
+    logger.info("Successfully fetched %s documents", len(all_documents))
     return all_documents
 
 
-def fetch_transcript(token: str, document_id: str) -> Optional[List[Dict]]:
+def iter_response(response: requests.Response) -> Iterator[bytes]:
+    """
+    Yield the body of a streamed response, closing it once done
+    """
+    try:
+        yield from response.iter_content(chunk_size=STREAM_CHUNK_SIZE)
+    finally:
+        response.close()
+
+
+def fetch_transcript(session: requests.Session, document_id: str,
+                     etag: Optional[str] = None) -> Union[Tuple[Iterable[bytes], Optional[str]], object, None]:
     """
     Fetch transcript for a specific document
     Adapted from sample_transcript.js
+    Returns the raw JSON array bytes without decoding them, as a sequence of chunks, and the response ETag
+    If an etag is given it is sent with the request, and NOT_MODIFIED returned if it still matches
     """
     url = "https://api.granola.ai/v1/get-document-transcript"
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json",
-        "Accept": "*/*",
-        "User-Agent": "Granola/5.354.0",
-        "X-Client-Version": "5.354.0"
-    }
     data = {"document_id": document_id}
+    headers = {"If-None-Match": etag} if etag else {}
 
     try:
-        response = requests.post(url, headers=headers, json=data)
+        response = session.post(url, json=data, headers=headers, stream=True)
+
+        if response.status_code == 304:
+            response.close()
+            return NOT_MODIFIED
+
+        # Only oversized successful bodies are streamed; reading the rest, including error
+        # responses, releases the connection right away
+        if response.ok and int(response.headers.get('Content-Length', 0)) > STREAM_THRESHOLD_BYTES:
+            chunks = iter_response(response)
+        else:
+            chunks = iter([response.content])
+
         response.raise_for_status()
 
-        transcript_data = response.json()
+        first_chunk = next(chunks, b'')
 
         # Return the full transcript data (array of entries)
-        if isinstance(transcript_data, list):
-            return transcript_data
+        if _JSON_ARRAY_START.match(first_chunk):
+            return chain([first_chunk], chunks), response.headers.get('ETag')
         else:
-            logger.warning(f"Unexpected transcript format for document {document_id}")
+            response.close()
+            logger.warning("Unexpected transcript format for document %s", document_id)
             return None
 
     except requests.exceptions.HTTPError as e:
         if e.response.status_code == 404:
-            logger.debug(f"No transcript found for document {document_id}")
+            logger.debug("No transcript found for document %s", document_id)
             return None
         else:
-            logger.error(f"HTTP error fetching transcript for {document_id}: {str(e)}")
+            logger.error("HTTP error fetching transcript for %s: %s", document_id, e)
             return None
     except Exception as e:
-        logger.error(f"Error fetching transcript for {document_id}: {str(e)}")
+        logger.error("Error fetching transcript for %s: %s", document_id, e)
         return None
 
 
@@ -157,15 +329,14 @@ def sanitize_filename(title: str) -> str:
     Convert a title to a valid filename
     Reused from sample_python.py with improvements
     """
-    if not title or title.strip() == "":
+    if not title or not title.strip():
         return "untitled"
 
     # Remove invalid characters
-    invalid_chars = '<>:"/\\|?*'
-    filename = ''.join(c for c in title if c not in invalid_chars)
+    filename = title.translate(_INVALID_FILENAME_CHARS)
 
     # Replace multiple spaces with single underscore
-    filename = '_'.join(filename.split())
+    filename = _WHITESPACE_RUN.sub('_', filename.strip())
 
     # Remove leading/trailing underscores and limit length
     filename = filename.strip('_')[:100]
@@ -180,7 +351,8 @@ def filter_documents_by_date(documents: List[Dict], days_ago: Optional[int]) ->
     if days_ago is None:
         return documents
 
-    cutoff_date = datetime.now() - timedelta(days=days_ago)
+    # API timestamps carry a UTC offset, so the cutoff must be timezone-aware too
+    cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_ago)
     filtered_docs = []
 
     for doc in documents:
@@ -188,92 +360,182 @@ def filter_documents_by_date(documents: List[Dict], days_ago: Optional[int]) ->
             # Parse the document creation date
             created_at = doc.get('created_at')
             if created_at:
-                doc_date = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
+                doc_date = datetime.fromisoformat(created_at)
                 if doc_date >= cutoff_date:
                     filtered_docs.append(doc)
         except Exception as e:
-            logger.debug(f"Error parsing date for document {doc.get('id', 'unknown')}: {e}")
+            logger.debug("Error parsing date for document %s: %s", doc.get('id', 'unknown'), e)
             # Include documents with unparseable dates
             filtered_docs.append(doc)
 
-    logger.info(f"Filtered to {len(filtered_docs)} documents from last {days_ago} days")
+    logger.info("Filtered to %s documents from last %s days", len(filtered_docs), days_ago)
     return filtered_docs
 
 
-def generate_filename(title: str, created_at: str) -> str:
-    """Generate a filename from document metadata"""
+def generate_filename(title: str, created_at: str, fallback_date_str: str) -> str:
+    """
+    Generate a filename from document metadata
+    fallback_date_str is used when created_at is missing or unparseable
+    """
     try:
         if created_at:
-            date_obj = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-            date_str = date_obj.strftime('%Y-%m-%d')
+            date_obj = datetime.fromisoformat(created_at)
+            date_str = date_obj.strftime(DATE_FORMAT)
         else:
-            date_str = datetime.now().strftime('%Y-%m-%d')
+            date_str = fallback_date_str
     except Exception:
-        date_str = datetime.now().strftime('%Y-%m-%d')
+        date_str = fallback_date_str
 
     sanitized_title = sanitize_filename(title)
     return f"{date_str}_{sanitized_title}.json"
 
 
-def process_document(token: str, doc: Dict, output_path: Path, force: bool, doc_num: int, total_docs: int) -> str:
-    """Process a single document and return result status"""
+def process_document(session: requests.Session, saves: queue.Queue, etags: Dict[str, str], doc: Dict,
+                     file_path: Path, revalidate: bool, download_timestamp: str,
+                     doc_num: int, total_docs: int) -> str:
+    """
+    Fetch a single document's transcript and queue it for saving
+    Returns "queued", or the final result status if there is nothing to save
+    """
     doc_id = doc.get('id', 'unknown')
     title = doc.get('title', 'Untitled')
     created_at = doc.get('created_at', '')
 
-    logger.info(f"Processing [{doc_num}/{total_docs}]: {title}")
+    logger.info("Processing [%s/%s]: %s", doc_num, total_docs, title)
 
-    filename = generate_filename(title, created_at)
-    file_path = output_path / filename
+    # Fetch transcript
+    fetched = fetch_transcript(session, doc_id, etags.get(doc_id) if revalidate else None)
 
-    # Skip if file exists and not forcing overwrite
-    if file_path.exists() and not force:
-        logger.debug(f"Skipping {filename} (already exists)")
+    if fetched is NOT_MODIFIED:
+        logger.debug("Skipping %s (unchanged)", file_path.name)
         return "skipped"
 
-    # Fetch transcript
-    transcript = fetch_transcript(token, doc_id)
-
-    if transcript is None:
-        logger.warning(f"No transcript available for: {title}")
+    if fetched is None:
+        logger.warning("No transcript available for: %s", title)
         return "error"
 
-    # Prepare JSON data with metadata
+    transcript, etag = fetched
+
+    # Prepare JSON data with metadata, leaving a placeholder for the transcript
     json_data = {
         "document_id": doc_id,
         "title": title,
         "created_at": created_at,
         "updated_at": doc.get('updated_at'),
-        "download_timestamp": datetime.now().isoformat(),
-        "transcript_entries": transcript
+        "download_timestamp": download_timestamp,
+        "transcript_entries": None
     }
 
-    # Save to file
+    saves.put((file_path, json_data, transcript, etag))
+    return "queued"
+
+
+def write_all(fd: int, data: bytes) -> None:
+    """
+    Write all of data to a file descriptor, continuing after partial writes
+    """
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def save_transcript(file_path: Path, overwrite: bool, json_data: Dict, transcript: Iterable[bytes]) -> str:
+    """Save a fetched transcript and return result status"""
+    filename = file_path.name
+
+    # Create the file exclusively unless overwriting, in case it appeared since the directory was listed
     try:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(json_data, f, indent=2, ensure_ascii=False)
+        fd = os.open(file_path, OPEN_FLAGS | (os.O_TRUNC if overwrite else os.O_EXCL), 0o644)
+    except FileExistsError:
+        logger.debug("Skipping %s (already exists)", filename)
+        return "skipped"
+    except Exception as e:
+        logger.error("Error saving %s: %s", filename, e)
+        return "error"
 
-        logger.debug(f"Saved: {filename}")
+    # Save to file, splicing the raw transcript bytes in place of the placeholder
+    try:
+        prefix, suffix = serialize_pretty(json_data).rsplit(b'null', 1)
+        try:
+            write_all(fd, prefix)
+            for chunk in transcript:
+                write_all(fd, chunk)
+            write_all(fd, suffix)
+        finally:
+            os.close(fd)
+
+        logger.debug("Saved: %s", filename)
         return "downloaded"
 
     except Exception as e:
-        logger.error(f"Error saving {filename}: {str(e)}")
+        logger.error("Error saving %s: %s", filename, e)
+        # Don't leave a partial file behind to be skipped on the next run
+        file_path.unlink(missing_ok=True)
         return "error"
 
 
+def save_worker(saves: queue.Queue, overwrite: bool, etags: Dict[str, str]) -> Counter:
+    """
+    Save queued transcripts until a None sentinel is received
+    ETags are only recorded for transcripts that were actually written
+    Returns a tally of result statuses
+    """
+    results = Counter()
+
+    while True:
+        item = saves.get()
+        if item is None:
+            return results
+
+        file_path, json_data, transcript, etag = item
+        result = save_transcript(file_path, overwrite, json_data, transcript)
+        results[result] += 1
+
+        if result == "downloaded" and etag:
+            etags[json_data["document_id"]] = etag
+
+
+def load_etags(output_path: Path) -> Dict[str, str]:
+    """
+    Load the ETags saved by the previous run, if any
+    """
+    try:
+        etags = parse_json((output_path / ETAG_CACHE_FILENAME).read_bytes())
+    except (OSError, ValueError):
+        return {}
+
+    # Ignore a cache that isn't a mapping of document IDs to ETag strings
+    if not isinstance(etags, dict):
+        return {}
+    return {doc_id: etag for doc_id, etag in etags.items() if isinstance(etag, str)}
+
+
+def save_etags(output_path: Path, etags: Dict[str, str]) -> None:
+    """
+    Save transcript ETags for the next run to revalidate against
+    """
+    try:
+        (output_path / ETAG_CACHE_FILENAME).write_bytes(serialize_pretty(etags))
+    except OSError as e:
+        logger.warning("Could not save ETag cache: %s", e)
+
+
 def print_summary(downloaded_count: int, skipped_count: int, error_count: int, output_path: Path) -> None:
     """Print download summary"""
     logger.info("Download complete!")
-    logger.info(f"Downloaded: {downloaded_count} transcripts")
-    logger.info(f"Skipped: {skipped_count} (already exist)")
-    logger.info(f"Errors: {error_count} (no transcript or save failed)")
-    logger.info(f"Files saved to: {output_path.absolute()}")
+    logger.info("Downloaded: %s transcripts", downloaded_count)
+    logger.info("Skipped: %s (already exist or unchanged)", skipped_count)
+    logger.info("Errors: %s (no transcript or save failed)", error_count)
+    logger.info("Files saved to: %s", output_path.absolute())
 
 
 def download_transcripts(output_dir: str = "transcripts", days_ago: Optional[int] = None,
-                        force: bool = False, verbose: bool = False) -> None:
+                        force: bool = False, verbose: bool = False, workers: int = DEFAULT_WORKERS,
+                        rate: float = DEFAULT_RATE_LIMIT, refresh: bool = False) -> None:
     """
     Main function to download all transcripts
+    Transcripts are fetched by a pool of worker threads and saved by a separate set of writer threads
+    force re-downloads every transcript; refresh only re-downloads existing ones whose ETag changed
     """
     try:
         # Set up logging level
@@ -283,7 +545,7 @@ def download_transcripts(output_dir: str = "transcripts", days_ago: Optional[int
         # Create output directory
         output_path = Path(output_dir)
         output_path.mkdir(exist_ok=True)
-        logger.info(f"Output directory: {output_path.absolute()}")
+        logger.info("Output directory: %s", output_path.absolute())
 
         # Load credentials
         logger.info("Loading Granola credentials...")
@@ -292,9 +554,12 @@ def download_transcripts(output_dir: str = "transcripts", days_ago: Optional[int
             logger.error("Failed to load credentials. Exiting.")
             return
 
+        # One session shares keep-alive connections across every API call
+        session = create_session(token, max(workers, PAGE_CONCURRENCY), rate)
+
         # Fetch all documents
         logger.info("Fetching documents from Granola API...")
-        documents = fetch_granola_documents(token)
+        documents = fetch_granola_documents(session)
         if not documents:
             logger.error("Failed to fetch documents. Exiting.")
             return
@@ -308,32 +573,108 @@ def download_transcripts(output_dir: str = "transcripts", days_ago: Optional[int
             return
 
         # Download transcripts
-        logger.info(f"Starting transcript download for {len(documents)} documents...")
+        logger.info("Starting transcript download for %s documents...", len(documents))
 
         downloaded_count = 0
         skipped_count = 0
         error_count = 0
 
+        # Computed once per run rather than per document
+        now = datetime.now()
+        fallback_date_str = now.strftime(DATE_FORMAT)
+        download_timestamp = now.isoformat()
+
+        # List the output directory once instead of checking each file
+        existing = {entry.name for entry in os.scandir(output_path)}
+
+        # ETags are always recorded; with --refresh, files we already have are only
+        # re-downloaded if their ETag changed
+        etags = load_etags(output_path)
+        overwrite = force or refresh
+        revalidate = refresh and not force
+
+        # Decide which document each output file comes from before fetching anything,
+        # so no two saves ever target the same path
+        scheduled = {}
         for i, doc in enumerate(documents, 1):
-            result = process_document(token, doc, output_path, force, i, len(documents))
+            title = doc.get('title', 'Untitled')
+            created_at = doc.get('created_at', '')
+            filename = generate_filename(title, created_at, fallback_date_str)
+
+            # Skip if file exists and not overwriting; later documents with the same filename are skipped too
+            if not overwrite and (filename in existing or filename in scheduled):
+                logger.debug("Skipping %s (already exists)", filename)
+                skipped_count += 1
+                continue
 
-            if result == "downloaded":
-                downloaded_count += 1
-            elif result == "skipped":
+            # When overwriting, each document would replace the one before it, so the last one wins
+            if filename in scheduled:
+                logger.debug("Skipping earlier document for %s (replaced by a later one)", filename)
                 skipped_count += 1
-            else:  # error
-                error_count += 1
 
-            # Small delay to be respectful to the API
-            time.sleep(0.1)
+            scheduled[filename] = (i, doc)
+
+        # Fetch threads hand transcripts to writer threads through a bounded queue,
+        # so saves overlap with fetches without unsaved transcripts piling up in memory
+        saves = queue.Queue(maxsize=SAVE_QUEUE_SIZE)
+
+        with ThreadPoolExecutor(max_workers=WRITER_WORKERS) as writer:
+            writers = [writer.submit(save_worker, saves, overwrite, etags) for _ in range(WRITER_WORKERS)]
+
+            try:
+                # The pool size bounds how many requests are in flight at once
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    # With --refresh, files we already have are revalidated against their ETag
+                    futures = [
+                        executor.submit(
+                            process_document, session, saves, etags, doc, output_path / filename,
+                            revalidate and filename in existing, download_timestamp, i, len(documents)
+                        )
+                        for filename, (i, doc) in scheduled.items()
+                    ]
+
+                    try:
+                        for future in as_completed(futures):
+                            result = future.result()
+
+                            if result == "skipped":
+                                skipped_count += 1
+                            elif result == "error":
+                                error_count += 1
+                    except BaseException:
+                        # Drop documents still waiting for a thread, so Ctrl-C stops promptly
+                        executor.shutdown(wait=True, cancel_futures=True)
+                        raise
+            finally:
+                # One sentinel per writer, queued after every fetched transcript
+                for _ in writers:
+                    saves.put(None)
+
+            results = sum((future.result() for future in writers), Counter())
+
+        downloaded_count += results["downloaded"]
+        skipped_count += results["skipped"]
+        error_count += results["error"]
+
+        save_etags(output_path, etags)
 
         print_summary(downloaded_count, skipped_count, error_count, output_path)
 
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
+        logger.error("Unexpected error: %s", e)
         raise
 
 
+def positive_int(value: str) -> int:
+    """
+    argparse type for counts that must be at least 1
+    """
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Download Granola meeting transcripts via API and save as JSON files"
@@ -353,11 +694,28 @@ def main():
         action="store_true",
         help="Force overwrite of existing files"
     )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Re-download existing transcripts only if they changed on the server (ignored with --force)"
+    )
     parser.add_argument(
         "-v", "--verbose",
         action="store_true",
         help="Enable verbose logging"
     )
+    parser.add_argument(
+        "-w", "--workers",
+        type=positive_int,
+        default=DEFAULT_WORKERS,
+        help=f"Number of transcripts to fetch concurrently (default: {DEFAULT_WORKERS})"
+    )
+    parser.add_argument(
+        "-r", "--rate",
+        type=float,
+        default=DEFAULT_RATE_LIMIT,
+        help=f"Maximum API requests per second, 0 for no limit (default: {DEFAULT_RATE_LIMIT})"
+    )
 
     args = parser.parse_args()
 
@@ -366,12 +724,15 @@ def main():
             output_dir=args.output,
             days_ago=args.days,
             force=args.force,
-            verbose=args.verbose
+            verbose=args.verbose,
+            workers=args.workers,
+            rate=args.rate,
+            refresh=args.refresh
         )
     except KeyboardInterrupt:
         logger.info("Download interrupted by user")
     except Exception as e:
-        logger.error(f"Download failed: {str(e)}")
+        logger.error("Download failed: %s", e)
         exit(1)
 
 